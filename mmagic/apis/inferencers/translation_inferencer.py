@@ -1,6 +1,7 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 import os
-from typing import Dict, List
+from copy import deepcopy
+from typing import Dict, List, Optional
 
 import numpy as np
 import torch
@@ -10,6 +11,7 @@ from mmengine.dataset.utils import default_collate as collate
 from torchvision import utils
 
 from mmagic.models.base_models import BaseTranslationModel
+from mmagic.utils import ConfigType
 from .base_mmagic_inferencer import BaseMMagicInferencer, InputsType, PredType
 
 
@@ -22,6 +24,21 @@ class TranslationInferencer(BaseMMagicInferencer):
         visualize=['result_out_dir'],
         postprocess=[])
 
+    def _init_model(self, cfg: ConfigType, ckpt: Optional[str],
+                    device: str) -> BaseTranslationModel:
+        """Initialize the model without discriminators, which are never
+        used in inference, and enable cuDNN autotuning for the fixed input
+        shape of the test pipeline."""
+        model_cfg = cfg.model
+        # build from a copy to keep the config of the caller unchanged
+        cfg.model = deepcopy(model_cfg)
+        cfg.model.build_discriminator = False
+        cfg.model.cudnn_benchmark = True
+        try:
+            return super()._init_model(cfg, ckpt, device)
+        finally:
+            cfg.model = model_cfg
+
     def preprocess(self, img: InputsType) -> Dict:
         """Process the inputs into a model-feedable format.
 
@@ -126,6 +126,8 @@ class MMagicInferencer:
 
     inference_supported_models_cfg = {}
     inference_supported_models_cfg_inited = False
+    # directory containing `configs/`, resolved once with the model cfgs
+    inference_supported_models_cfg_root = None
 
     def __init__(self,
                  model_name: str = None,
@@ -169,13 +171,8 @@ class MMagicInferencer:
                         config_dir = setting['Config']
                         break
             config_dir = config_dir[config_dir.find('configs'):]
-            if osp.exists(
-                    osp.join(osp.dirname(__file__), '..', '..', config_dir)):
-                kwargs['config'] = osp.join(
-                    osp.dirname(__file__), '..', '..', config_dir)
-            else:
-                kwargs['config'] = osp.join(
-                    osp.dirname(__file__), '..', '.mim', config_dir)
+            kwargs['config'] = osp.join(
+                self.inference_supported_models_cfg_root, config_dir)
             if 'Weights' in cfgs['settings'][setting_to_use].keys():
                 kwargs['ckpt'] = cfgs['settings'][setting_to_use]['Weights']
                 if model_name == 'controlnet':
@@ -246,21 +243,23 @@ class MMagicInferencer:
         Returns:
             dict: Model configuration.
         """
-        if model_name not in self.inference_supported_models:
+        # the configs of supported models are parsed once and cached at class
+        # level, so this is a dict lookup
+        model_cfg = self.inference_supported_models_cfg.get(model_name)
+        if model_cfg is None:
             raise ValueError(f'Model {model_name} is not supported.')
-        else:
-            return self.inference_supported_models_cfg[model_name]
+        return model_cfg
 
     @staticmethod
     def init_inference_supported_models_cfg() -> None:
         if not MMagicInferencer.inference_supported_models_cfg_inited:
             if osp.exists(
                     osp.join(osp.dirname(__file__), '..', '..', 'configs')):
-                all_cfgs_dir = osp.join(
-                    osp.dirname(__file__), '..', '..', 'configs')
+                cfg_root = osp.join(osp.dirname(__file__), '..', '..')
             else:
-                all_cfgs_dir = osp.join(
-                    osp.dirname(__file__), '..', '.mim', 'configs')
+                cfg_root = osp.join(osp.dirname(__file__), '..', '.mim')
+            MMagicInferencer.inference_supported_models_cfg_root = cfg_root
+            all_cfgs_dir = osp.join(cfg_root, 'configs')
             for model_name in MMagicInferencer.inference_supported_models:
                 meta_file_dir = osp.join(all_cfgs_dir, model_name,
                                          'metafile.yml')
@@ -1,15 +1,47 @@
 # Copyright (c) OpenMMLab. All rights reserved.
+import warnings
 from abc import ABCMeta
 from collections import defaultdict
+from contextlib import contextmanager, nullcontext
 from copy import deepcopy
 from typing import List, Optional
 
+import torch
 import torch.nn as nn
 from mmengine.model import BaseModel, is_model_wrapper
 
 from mmagic.registry import MODELS
 
 
+def _copy_cfg(cfg):
+    """Copy the containers of a config, which is much cheaper than
+    `deepcopy` since configs only hold plain data.
+
+    Args:
+        cfg (Any): The config to copy.
+
+    Returns:
+        Any: The copied config. Leaves are not copied.
+    """
+    if isinstance(cfg, dict):
+        return type(cfg)({k: _copy_cfg(v) for k, v in cfg.items()})
+    if isinstance(cfg, (list, tuple)):
+        return type(cfg)(_copy_cfg(v) for v in cfg)
+    return cfg
+
+
+@contextmanager
+def _cudnn_benchmark():
+    """Enable `torch.backends.cudnn.benchmark` in the context and restore
+    the previous value on exit."""
+    benchmark = torch.backends.cudnn.benchmark
+    torch.backends.cudnn.benchmark = True
+    try:
+        yield
+    finally:
+        torch.backends.cudnn.benchmark = benchmark
+
+
 @MODELS.register_module()
 class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
     """Base Translation Model.
@@ -42,8 +74,58 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
             completely updated before the generator is updated. Defaults to 1.
         disc_init_steps (int): The number of initial steps used only to train
             discriminators.
+        share_generators_by_arch (bool): Whether to build a single generator
+            and share it among all reachable domains, since they are built
+            from the same config. Only use it when one translator is
+            intended for all domains. Defaults to False.
+        build_discriminator (bool): Whether to build discriminators. Set it
+            to False for inference-only usage to save memory and init time.
+            Defaults to True.
+        compile_generator (bool): Whether to wrap each generator with
+            `torch.compile` for inference. The compiled wrappers are only
+            used by `forward_test` (also of subclasses like Pix2Pix and
+            CycleGAN), and never in training. They are kept outside of
+            `self.generators`, so the keys of the state dict are unchanged.
+            Generators shared by domains are compiled once. Ignored if
+            `torch.compile` is not available. Defaults to False.
+        compile_mode (str): The mode passed to `torch.compile`.
+            Defaults to 'reduce-overhead'.
+        fuse_conv_bn (bool): Whether to fold BatchNorm layers into the
+            preceding convolutions of the target generator before the first
+            `forward_test` in eval mode. Pix2Pix and CycleGAN always run
+            `forward_test` in training mode, so this has no effect on any
+            translation model in the tree. See :meth:`fuse_for_inference`.
+            Defaults to False.
+        use_cuda_graph (bool): Whether to capture the generator into a CUDA
+            Graph in `forward_test` and replay it for CUDA inputs with a
+            seen shape and dtype. Graphs are only captured and replayed in
+            eval mode. Note that Pix2Pix and CycleGAN switch to training mode
+            in `forward_test` on purpose, so this has no effect on any
+            translation model in the tree and only applies to models whose
+            `forward_test` runs in eval mode. Defaults to False.
+        cuda_graph_cache_size (int): The maximum number of captured CUDA
+            Graphs. Each graph holds its own memory pool, and the earliest
+            captured one is released when the cache is full. Defaults to 8.
+        channels_last (bool): Whether to convert generators and 4D input
+            images to `torch.channels_last` memory format, which lets cuDNN
+            dispatch faster NHWC convolution kernels. Defaults to False.
+        cudnn_benchmark (bool): Whether to enable
+            `torch.backends.cudnn.benchmark` while translating CUDA images
+            in `forward_test` (also of subclasses). It benefits inference
+            with fixed input shapes at the cost of a slower first call for
+            each new shape. The global setting is restored after each call.
+            Defaults to False.
+        fp16_enabled (bool): Whether to run `forward_test` (also of
+            subclasses like Pix2Pix and CycleGAN) under fp16 autocast for
+            CUDA inputs. The output is cast back to the dtype of the input
+            image. Defaults to False.
     """
 
+    # Whether `forward_test` runs generators in training mode on purpose,
+    # e.g. Pix2Pix and CycleGAN. Optimizations that freeze eval mode
+    # behaviors are refused for such models.
+    test_in_train_mode = False
+
     def __init__(self,
                  generator,
                  discriminator,
@@ -54,11 +136,27 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
                  discriminator_steps: int = 1,
                  disc_init_steps: int = 0,
                  real_img_key: str = 'real_img',
-                 loss_config: Optional[dict] = None):
+                 loss_config: Optional[dict] = None,
+                 share_generators_by_arch: bool = False,
+                 build_discriminator: bool = True,
+                 compile_generator: bool = False,
+                 compile_mode: str = 'reduce-overhead',
+                 fuse_conv_bn: bool = False,
+                 use_cuda_graph: bool = False,
+                 cuda_graph_cache_size: int = 8,
+                 channels_last: bool = False,
+                 cudnn_benchmark: bool = False,
+                 fp16_enabled: bool = False):
         super().__init__(data_preprocessor)
         self._default_domain = default_domain
         self._reachable_domains = reachable_domains
         self._related_domains = related_domains
+        self._reachable_set = frozenset(reachable_domains)
+        # domains are fixed after init, so precompute `get_other_domains`
+        self._other_domains = {
+            domain: tuple(d for d in related_domains if d != domain)
+            for domain in set(related_domains) | set(reachable_domains)
+        }
         assert self._default_domain in self._reachable_domains
         assert set(self._reachable_domains) <= set(self._related_domains)
 
@@ -66,19 +164,57 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
         self.disc_init_steps = disc_init_steps
         self.real_img_key = real_img_key
 
-        self._gen_cfg = deepcopy(generator)
+        self._gen_cfg = _copy_cfg(generator)
         # build domain generators
         self.generators = nn.ModuleDict()
+        self.share_generators_by_arch = share_generators_by_arch
+        if self.share_generators_by_arch:
+            shared_generator = MODELS.build(generator)
         for domain in self._reachable_domains:
-            self.generators[domain] = MODELS.build(generator)
+            if self.share_generators_by_arch:
+                self.generators[domain] = shared_generator
+            else:
+                self.generators[domain] = MODELS.build(generator)
+        self.channels_last = channels_last
+        if self.channels_last:
+            self.generators.to(memory_format=torch.channels_last)
+        self.fp16_enabled = fp16_enabled
+        self.cudnn_benchmark = cudnn_benchmark
+
+        # id(generator) -> compiled wrapper, which is shared by domains
+        # sharing the generator and not registered as a submodule
+        self._compiled_generators = dict()
+        if compile_generator and not hasattr(torch, 'compile'):
+            warnings.warn('`torch.compile` is not supported by torch '
+                          f'{torch.__version__}, generators will run in '
+                          'eager mode.')
+            compile_generator = False
+        self.compile_generator = compile_generator
+        self.compile_mode = compile_mode
+        if self.compile_generator:
+            for domain in self._reachable_domains:
+                self._compile_generator(self.generators[domain])
+        # domain -> generator used by `translation`
+        self._gen_by_domain = dict()
+        for domain in self._reachable_domains:
+            self._cache_generator(domain)
+
+        self.fuse_conv_bn = fuse_conv_bn
+        self._fused_domains = set()
+        self._unfusable_domains = set()
+
+        # (domain, shape, dtype) -> (graph, static input, static output)
+        self.use_cuda_graph = use_cuda_graph
+        self.cuda_graph_cache_size = cuda_graph_cache_size
+        self._graph_cache = dict()
 
-        self._disc_cfg = deepcopy(discriminator)
+        self._disc_cfg = _copy_cfg(discriminator)
         # build domain discriminators
-        if discriminator is not None:
+        if discriminator is not None and build_discriminator:
             self.discriminators = nn.ModuleDict()
             for domain in self._reachable_domains:
                 self.discriminators[domain] = MODELS.build(discriminator)
-        # support no discriminator in testing
+        # support no discriminator in testing and inference
         else:
             self.discriminators = None
 
@@ -93,21 +229,34 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
         """
         self._params_init_info = defaultdict(dict)
 
+        init_info = f'The value is the same before and ' \
+                    f'after calling `init_weights` ' \
+                    f'of {self.__class__.__name__} '
+        # compute the means of parameters on the same device with one
+        # device-to-host copy instead of one synchronization per parameter
+        params_by_device = defaultdict(list)
         for _, param in self.named_parameters():
-            self._params_init_info[param][
-                'init_info'] = f'The value is the same before and ' \
-                                f'after calling `init_weights` ' \
-                                f'of {self.__class__.__name__} '
-            mean = param.data.mean().cpu()
-            self._params_init_info[param]['tmp_mean_value'] = mean
-
+            params_by_device[(param.device, param.dtype)].append(param)
+        for params in params_by_device.values():
+            means = torch.stack([param.data.mean() for param in params]).cpu()
+            for param, mean in zip(params, means):
+                self._params_init_info[param] = dict(
+                    init_info=init_info, tmp_mean_value=mean)
+
+        # shared generators should only be initialized once
+        visited_gens = set()
+        # modules holding `_params_init_info`, which is removed at the end
+        touched = [self]
         for domain in self._reachable_domains:
             if is_model_wrapper(self.generators):
                 gen = self.generators.module[domain]
             else:
                 gen = self.generators[domain]
-            gen._params_init_info = self._params_init_info
-            gen.init_weights()
+            if id(gen) not in visited_gens:
+                visited_gens.add(id(gen))
+                gen._params_init_info = self._params_init_info
+                touched.append(gen)
+                gen.init_weights()
 
             if self.discriminators is not None:
                 if is_model_wrapper(self.discriminators):
@@ -115,12 +264,22 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
                 else:
                     disc = self.discriminators[domain]
                 disc._params_init_info = self._params_init_info
+                touched.append(disc)
                 disc.init_weights()
 
         super()._dump_init_info()
-        for m in self.modules():
-            if hasattr(m, '_params_init_info'):
-                del m._params_init_info
+        for m in touched:
+            del m._params_init_info
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """Ignore weights of discriminators if they are not built, so that
+        full checkpoints can be loaded for inference without unexpected
+        keys."""
+        if self.discriminators is None:
+            disc_prefix = f'{prefix}discriminators.'
+            for key in [k for k in state_dict if k.startswith(disc_prefix)]:
+                del state_dict[key]
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
 
     def get_module(self, module):
         """Get `nn.ModuleDict` to fit the `MMDistributedDataParallel`
@@ -177,36 +336,382 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
         Returns:
             dict: Forward results.
         """
-        target = self.translation(img, target_domain=target_domain, **kwargs)
-        results = dict(source=img.cpu(), target=target.cpu())
+        target = self._forward_inference(img, target_domain, **kwargs)
+        source, target = self._to_host(img, target)
+        results = dict(source=source, target=target)
+        return results
+
+    def _forward_inference(self,
+                           img,
+                           target_domain=None,
+                           inference_mode=True,
+                           **kwargs):
+        """Translate images for testing and inference without gradients. It
+        is shared by `forward_test` of this class and subclasses.
+
+        Args:
+            img (tensor): Input image tensor.
+            target_domain (str, optional): Target domain of output image.
+                Default to None.
+            inference_mode (bool): Whether to run under
+                `torch.inference_mode`, otherwise under `torch.no_grad`.
+                Outputs of inference mode cannot be modified in-place outside
+                of it and may be buffers reused by the next call, so only set
+                it to True when the outputs are consumed right away, e.g.,
+                copied to host. Default to True.
+            kwargs (dict): Other arguments.
+
+        Returns:
+            tensor: Image tensor of target style with the dtype of `img`.
+        """
+        if target_domain is None:
+            target_domain = self._default_domain
+        # fusion creates new parameters and thus is kept out of inference mode
+        if self.fuse_conv_bn and not self.training:
+            if (target_domain not in self._fused_domains
+                    and target_domain not in self._unfusable_domains):
+                self.fuse_for_inference(target_domain)
+
+        if inference_mode:
+            grad_context = torch.inference_mode()
+        else:
+            grad_context = torch.no_grad()
+        use_graph = (
+            self.use_cuda_graph and not self.training and img.is_cuda
+            and not kwargs)
+        if self.fp16_enabled and img.is_cuda:
+            # weight cache of autocast is disabled to be compatible with
+            # CUDA Graph capture
+            autocast = torch.autocast(
+                device_type='cuda',
+                dtype=torch.float16,
+                cache_enabled=not use_graph)
+        else:
+            autocast = nullcontext()
+        if self.cudnn_benchmark and img.is_cuda:
+            benchmark = _cudnn_benchmark()
+        else:
+            benchmark = nullcontext()
+        compiled_gen = self._compiled_generators.get(
+            id(self._gen_by_domain.get(target_domain)))
+        # whether the output is a buffer reused by the next call
+        reused_output = True
+        with grad_context, autocast, benchmark:
+            if use_graph:
+                target = self._graph_translation(img, target_domain)
+            elif compiled_gen is not None:
+                # compiled modules may run with CUDA Graphs as well
+                target = compiled_gen(self._format_input(img), **kwargs)
+            else:
+                target = self.translation(
+                    img, target_domain=target_domain, **kwargs)
+                reused_output = False
+        # outputs kept by the caller should not be overwritten by next call
+        return target.to(
+            img.dtype, copy=reused_output and not inference_mode)
+
+    @staticmethod
+    def _to_host(*tensors):
+        """Move tensors to host. CUDA tensors are copied to pinned memory
+        without blocking and the current stream of each source device is
+        synchronized once at the end, instead of blocking on each `.cpu()`
+        call.
+
+        Args:
+            tensors (tensor): Tensors to be moved.
+
+        Returns:
+            list[tensor]: Tensors on host.
+        """
+        results = []
+        devices = set()
+        for tensor in tensors:
+            if tensor.is_cuda:
+                host_tensor = torch.empty(
+                    tensor.shape, dtype=tensor.dtype, pin_memory=True)
+                host_tensor.copy_(tensor, non_blocking=True)
+                results.append(host_tensor)
+                devices.add(tensor.device)
+            else:
+                results.append(tensor.cpu())
+        for device in devices:
+            torch.cuda.current_stream(device).synchronize()
         return results
 
+    def _graph_translation(self, image, target_domain):
+        """Translate image by replaying a captured CUDA Graph. The graph is
+        captured on the first call for each domain, shape and dtype. It
+        should only be called in eval mode, since the behavior of BatchNorm
+        and Dropout layers is fixed in the captured graph.
+
+        Args:
+            image (tensor): Image tensor on CUDA device.
+            target_domain (str): Target domain of output image.
+
+        Returns:
+            tensor: Image tensor of target style. It is the static output
+                buffer of the graph and will be overwritten by the next
+                replay.
+        """
+        key = (target_domain, tuple(image.shape), image.dtype)
+        if key not in self._graph_cache:
+            _model = self._get_target_generator(target_domain)
+            # static buffers are normal tensors, so that graphs captured
+            # under `torch.inference_mode` can be replayed out of it
+            with torch.inference_mode(False), torch.no_grad():
+                static_in = torch.empty_like(self._format_input(image))
+                static_in.copy_(image)
+                # warmup on a side stream before capturing, which also
+                # finishes cuDNN autotuning for this shape when
+                # `cudnn.benchmark` is on, so no benchmarking is captured
+                stream = torch.cuda.Stream()
+                stream.wait_stream(torch.cuda.current_stream())
+                with torch.cuda.stream(stream):
+                    for _ in range(3):
+                        _model(static_in)
+                torch.cuda.current_stream().wait_stream(stream)
+
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    static_out = _model(static_in)
+            # dicts keep insertion order, so the first key is the earliest
+            while len(self._graph_cache) >= self.cuda_graph_cache_size:
+                self._graph_cache.pop(next(iter(self._graph_cache)))
+            self._graph_cache[key] = (graph, static_in, static_out)
+
+        graph, static_in, static_out = self._graph_cache[key]
+        static_in.copy_(image)
+        graph.replay()
+        return static_out
+
+    def fuse_for_inference(self, domain=None):
+        """Fold BatchNorm layers into the preceding convolutions of
+        generators. The generator is traced by `torch.fx` and replaced by the
+        fused `GraphModule`, thus this should only be called for inference.
+        The fused generators have no BatchNorm keys in the state dict, so
+        saving or loading checkpoints afterwards is not supported.
+        Generators that cannot be traced are left unchanged. Models that run
+        generators in training mode at test time, e.g. Pix2Pix and CycleGAN,
+        are refused.
+
+        Args:
+            domain (str, optional): The domain of generator to fuse. If None,
+                generators of all reachable domains will be fused.
+                Generators shared with other domains are fused once for all
+                of them. Default to None.
+        """
+        self._check_not_test_in_train_mode('folding BatchNorm')
+        from torch.fx.experimental.optimization import fuse
+
+        domains = self._reachable_domains if domain is None else [domain]
+        gen_ids = set(id(self._get_target_generator(d)) for d in domains)
+        fused_gens = dict()
+        for domain in self._reachable_domains:
+            gen = self._get_target_generator(domain)
+            if id(gen) not in gen_ids or domain in self._fused_domains:
+                continue
+            if id(gen) not in fused_gens:
+                assert not gen.training, \
+                    'Conv-BN fusion only works in eval mode.'
+                try:
+                    fused_gens[id(gen)] = fuse(gen)
+                except Exception as e:
+                    warnings.warn(
+                        f'Fail to fuse generator of domain \'{domain}\' '
+                        f'and fallback to the original one: {e}')
+                    fused_gens[id(gen)] = None
+            if fused_gens[id(gen)] is None:
+                self._unfusable_domains.add(domain)
+            else:
+                self._set_generator(domain, fused_gens[id(gen)])
+                self._fused_domains.add(domain)
+
+    def script_for_inference(self, freeze=False):
+        """Compile generators with TorchScript, which mainly speeds up CPU
+        inference. Generators that cannot be scripted are left unchanged,
+        e.g. those built from mmcv `ConvModule` like the generators of
+        Pix2Pix and CycleGAN.
+
+        Args:
+            freeze (bool): Whether to freeze the scripted generators, which
+                enables Conv-BN folding and constant propagation. The frozen
+                generators always run in eval mode, so freezing is refused
+                for models that run generators in training mode at test
+                time, e.g. Pix2Pix and CycleGAN. Default to False.
+        """
+        if freeze:
+            self._check_not_test_in_train_mode('freezing generators')
+        scripted_gens = dict()
+        for domain in self._reachable_domains:
+            gen = self._get_target_generator(domain)
+            # keep shared generators shared
+            if id(gen) not in scripted_gens:
+                try:
+                    scripted_gen = torch.jit.script(gen)
+                    if freeze:
+                        scripted_gen = torch.jit.freeze(scripted_gen.eval())
+                except Exception as e:
+                    warnings.warn(
+                        f'Fail to script generator of domain \'{domain}\' '
+                        f'and fallback to the original one: {e}')
+                    scripted_gen = gen
+                scripted_gens[id(gen)] = scripted_gen
+            if scripted_gens[id(gen)] is not gen:
+                self._set_generator(domain, scripted_gens[id(gen)])
+
+    def quantize_for_inference(self, calib_inputs, backend='x86'):
+        """Quantize generators to int8 with post-training static quantization
+        in FX graph mode, which speeds up CPU inference. The quantized
+        generators only run on CPU and always behave as in eval mode, thus
+        quantization is refused for models that run generators in training
+        mode at test time, e.g. Pix2Pix and CycleGAN. Generators that cannot
+        be traced or run after quantization are left unchanged.
+
+        Args:
+            calib_inputs (list[tensor]): Input images used to calibrate the
+                quantization parameters. More images that are representative
+                of the inference data give more accurate ranges.
+            backend (str): The quantization backend. Default to 'x86'.
+        """
+        self._check_not_test_in_train_mode('quantizing generators')
+        from torch.ao.quantization import get_default_qconfig_mapping
+        from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+        qconfig_mapping = get_default_qconfig_mapping(backend)
+        quantized_gens = dict()
+        for domain in self._reachable_domains:
+            gen = self._get_target_generator(domain)
+            # keep shared generators shared
+            if id(gen) not in quantized_gens:
+                try:
+                    prepared_gen = prepare_fx(
+                        deepcopy(gen).eval(),
+                        qconfig_mapping,
+                        example_inputs=(calib_inputs[0], ))
+                    with torch.no_grad():
+                        for calib_input in calib_inputs:
+                            prepared_gen(calib_input)
+                        quantized_gen = convert_fx(prepared_gen)
+                        # some quantized ops are not supported by backends
+                        quantized_gen(calib_inputs[0])
+                    quantized_gens[id(gen)] = quantized_gen
+                except Exception as e:
+                    warnings.warn(
+                        f'Fail to quantize generator of domain \'{domain}\' '
+                        f'and fallback to the original one: {e}')
+                    quantized_gens[id(gen)] = gen
+            if quantized_gens[id(gen)] is not gen:
+                self._set_generator(domain, quantized_gens[id(gen)])
+
+    def _check_not_test_in_train_mode(self, action):
+        """Raise an error if generators run in training mode at test time,
+        since they would always behave as in eval mode after `action`.
+
+        Args:
+            action (str): Description of the refused optimization.
+        """
+        if self.test_in_train_mode:
+            raise RuntimeError(
+                f'{self.__class__.__name__} runs generators in training mode '
+                f'at test time, {action} in eval mode would change its '
+                'outputs.')
+
+    def _set_generator(self, domain, generator):
+        """Replace the generator of the given domain and drop the compiled
+        module and CUDA Graphs that are built on the old one.
+
+        Args:
+            domain (str): Domain of the generator.
+            generator (nn.Module): The new generator.
+        """
+        if self.channels_last:
+            generator.to(memory_format=torch.channels_last)
+        self.get_module(self.generators)[domain] = generator
+        self._cache_generator(domain)
+        if self.compile_generator:
+            self._compile_generator(generator)
+            # release wrappers of generators that are no longer used
+            gen_ids = set(id(gen) for gen in self._gen_by_domain.values())
+            for gen_id in list(self._compiled_generators.keys()):
+                if gen_id not in gen_ids:
+                    self._compiled_generators.pop(gen_id)
+        for key in list(self._graph_cache.keys()):
+            if key[0] == domain:
+                self._graph_cache.pop(key)
+
+    def _compile_generator(self, generator):
+        """Wrap the generator with `torch.compile` unless it is compiled
+        already, e.g. shared by another domain.
+
+        Args:
+            generator (nn.Module): The generator to compile.
+        """
+        if id(generator) not in self._compiled_generators:
+            self._compiled_generators[id(generator)] = torch.compile(
+                generator, mode=self.compile_mode, dynamic=False)
+
+    def _cache_generator(self, domain):
+        """Cache the generator of the given domain for `translation`, which
+        saves the reachability check and the `get_module` call per forward.
+
+        Args:
+            domain (str): Domain of the generator.
+        """
+        self._gen_by_domain[domain] = self.get_module(self.generators)[domain]
+
     def is_domain_reachable(self, domain):
         """Whether image of this domain can be generated."""
-        return domain in self._reachable_domains
+        return domain in self._reachable_set
 
     def get_other_domains(self, domain):
         """get other domains."""
-        return list(set(self._related_domains) - set([domain]))
+        other_domains = self._other_domains.get(domain)
+        if other_domains is None:
+            other_domains = tuple(self._related_domains)
+        return other_domains
 
     def _get_target_generator(self, domain):
         """get target generator."""
-        assert self.is_domain_reachable(
-            domain
-        ), f'{domain} domain is not reachable, available domain list is\
-            {self._reachable_domains}'
+        if domain not in self._reachable_set:
+            raise ValueError(f'{domain} domain is not reachable, available '
+                             f'domain list is {self._reachable_domains}')
 
         return self.get_module(self.generators)[domain]
 
     def _get_target_discriminator(self, domain):
         """get target discriminator."""
-        assert self.is_domain_reachable(
-            domain
-        ), f'{domain} domain is not reachable, available domain list is\
-            {self._reachable_domains}'
+        if self.discriminators is None:
+            raise RuntimeError('Discriminators are not built, please check '
+                               'the `discriminator` and `build_discriminator` '
+                               f'arguments of {self.__class__.__name__}.')
+        if domain not in self._reachable_set:
+            raise ValueError(f'{domain} domain is not reachable, available '
+                             f'domain list is {self._reachable_domains}')
 
         return self.get_module(self.discriminators)[domain]
 
+    def _format_input(self, image):
+        """Convert 4D image to `torch.channels_last` memory format if
+        `channels_last` is enabled."""
+        if self.channels_last and image.dim() == 4:
+            image = image.contiguous(memory_format=torch.channels_last)
+        return image
+
+    def translate_default(self, image):
+        """Translation Image to the default domain without extra arguments.
+        This is the fast path of :meth:`translation`, which is taken when no
+        target domain other than the default one and no extra arguments are
+        given.
+
+        Args:
+            image (tensor): Image tensor with a shape of (N, C, H, W).
+
+        Returns:
+            tensor: Image tensor of the default domain.
+        """
+        _model = self._gen_by_domain[self._default_domain]
+        return _model(self._format_input(image))
+
     def translation(self, image, target_domain=None, **kwargs):
         """Translation Image to target style.
 
@@ -218,8 +723,14 @@ class BaseTranslationModel(BaseModel, metaclass=ABCMeta):
         Returns:
             dict: Image tensor of target style.
         """
+        if not kwargs and (target_domain is None
+                           or target_domain == self._default_domain):
+            return self.translate_default(image)
         if target_domain is None:
             target_domain = self._default_domain
-        _model = self._get_target_generator(target_domain)
-        outputs = _model(image, **kwargs)
+        _model = self._gen_by_domain.get(target_domain)
+        if _model is None:
+            # raise ValueError for unreachable domain
+            _model = self._get_target_generator(target_domain)
+        outputs = _model(self._format_input(image), **kwargs)
         return outputs
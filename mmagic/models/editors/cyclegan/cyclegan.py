@@ -21,6 +21,9 @@ class CycleGAN(BaseTranslationModel):
     Networks
     """
 
+    # generators run in training mode in `forward_test`
+    test_in_train_mode = True
+
     def __init__(self,
                  *args,
                  buffer_size=50,
@@ -49,7 +52,8 @@ class CycleGAN(BaseTranslationModel):
         # This is a trick for CycleGAN
         # ref: https://github.com/junyanz/pytorch-CycleGAN-and-pix2pix/blob/e1bdf46198662b0f4d0b318e24568205ec4d7aee/test.py#L54 # noqa
         self.train()
-        target = self.translation(img, target_domain=target_domain, **kwargs)
+        target = self._forward_inference(
+            img, target_domain=target_domain, inference_mode=False, **kwargs)
         results = dict(source=img, target=target)
         return results
 
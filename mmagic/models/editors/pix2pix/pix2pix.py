@@ -18,6 +18,9 @@ class Pix2Pix(BaseTranslationModel):
      Image-to-Image Translation with Conditional Adversarial Networks
     """
 
+    # generators run in training mode in `forward_test`
+    test_in_train_mode = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pixel_loss_weight = self.loss_config.get('pixel_loss_weight', 100)
@@ -36,7 +39,8 @@ class Pix2Pix(BaseTranslationModel):
         # This is a trick for Pix2Pix
         # ref: https://github.com/junyanz/pytorch-CycleGAN-and-pix2pix/blob/e1bdf46198662b0f4d0b318e24568205ec4d7aee/test.py#L54  # noqa
         self.train()
-        target = self.translation(img, target_domain=target_domain, **kwargs)
+        target = self._forward_inference(
+            img, target_domain=target_domain, inference_mode=False, **kwargs)
         results = dict(source=img, target=target)
         return results
 
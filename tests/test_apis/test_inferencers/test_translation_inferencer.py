@@ -1,8 +1,13 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 import os.path as osp
+from tempfile import TemporaryDirectory
+
+import torch
+from mmengine import Config
 
 from mmagic.apis.inferencers.translation_inferencer import \
     TranslationInferencer
+from mmagic.registry import MODELS
 from mmagic.utils import register_all_modules
 
 register_all_modules()
@@ -21,6 +26,8 @@ def test_translation_inferencer():
 
     inferencer_instance = \
         TranslationInferencer(cfg, None)
+    # discriminators are not needed in inference
+    assert inferencer_instance.model.discriminators is None
     inferencer_instance(img=data_path)
     inference_result = inferencer_instance(
         img=data_path, result_out_dir=result_out_dir)
@@ -28,6 +35,29 @@ def test_translation_inferencer():
     assert result_img[0].cpu().numpy().shape == (3, 256, 256)
 
 
+def test_translation_inferencer_init_model():
+    cfg = Config.fromfile(
+        osp.join(
+            osp.dirname(__file__), '..', '..', '..', 'configs', 'pix2pix',
+            'pix2pix_vanilla-unet-bn_1xb1-80kiters_facades.py'))
+    model = MODELS.build(cfg.model)
+    benchmark = torch.backends.cudnn.benchmark
+    with TemporaryDirectory() as tmp_dir:
+        ckpt = osp.join(tmp_dir, 'ckpt.pth')
+        torch.save(dict(state_dict=model.state_dict()), ckpt)
+        inferencer_instance = TranslationInferencer(cfg, ckpt)
+    assert inferencer_instance.model.discriminators is None
+    state_dict = model.generators.state_dict()
+    gen_state_dict = inferencer_instance.model.generators.state_dict()
+    for k, v in gen_state_dict.items():
+        assert torch.equal(v.cpu(), state_dict[k])
+    # config of the caller is not modified
+    assert 'build_discriminator' not in cfg.model
+    assert 'cudnn_benchmark' not in cfg.model
+    # the global cuDNN setting is not changed
+    assert torch.backends.cudnn.benchmark == benchmark
+
+
 def teardown_module():
     import gc
     gc.collect()
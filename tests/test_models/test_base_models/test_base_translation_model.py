@@ -1,23 +1,44 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 import torch
 from mmengine.model import MMDistributedDataParallel
+from torch import nn
 
 from mmagic.models import BaseTranslationModel
+from mmagic.registry import MODELS
+
+
+@MODELS.register_module()
+class ToyConvBNGenerator(nn.Module):
+    """A Conv-BN-ReLU generator for testing inference optimizations."""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv2d(3, 3, 3, 1, 1)
+        self.bn = nn.BatchNorm2d(3)
+        self.relu = nn.ReLU()
+
+    def forward(self, x):
+        return self.relu(self.bn(self.conv(x)))
+
+    def init_weights(self):
+        pass
 
 
 class ToyTranslationModel(BaseTranslationModel):
 
-    def __init__(self, generator, discriminator=None):
+    def __init__(self, generator, discriminator=None, **kwargs):
         super().__init__(
             generator=generator,
             discriminator=discriminator,
             default_domain='A',
             reachable_domains=['A'],
             related_domains=['A', 'B'],
-            data_preprocessor=None)
+            data_preprocessor=None,
+            **kwargs)
 
 
 class TestBaseTranslationModel(TestCase):
@@ -47,11 +68,68 @@ class TestBaseTranslationModel(TestCase):
         model = ToyTranslationModel(
             generator=self.generator, discriminator=None)
         self.assertIsNone(model.discriminators)
+        # test configs are copied
+        self.assertEqual(model._gen_cfg, self.generator)
+        self.assertIsNot(model._gen_cfg['norm_cfg'],
+                         self.generator['norm_cfg'])
 
         # test disc is not None
         model = ToyTranslationModel(
             generator=self.generator, discriminator=self.discriminator)
         self.assertIsNotNone(model.discriminators)
+        self.assertIs(model._get_target_discriminator('A'),
+                      model.discriminators['A'])
+        # test only generators and discriminators are registered
+        self.assertEqual(
+            set(dict(model.named_children())),
+            {'data_preprocessor', 'generators', 'discriminators'})
+        self.assertTrue(
+            all(
+                k.startswith(('generators.A.', 'discriminators.A.'))
+                for k in model.state_dict()))
+        with self.assertRaises(ValueError):
+            model._get_target_discriminator('B')
+
+        # test build_discriminator is False
+        model = ToyTranslationModel(
+            generator=self.generator,
+            discriminator=self.discriminator,
+            build_discriminator=False)
+        self.assertIsNone(model.discriminators)
+        with self.assertRaises(RuntimeError):
+            model._get_target_discriminator('A')
+        # weights of discriminators that are not built are ignored
+        full_model = ToyTranslationModel(
+            generator=self.generator, discriminator=self.discriminator)
+        model.load_state_dict(full_model.state_dict(), strict=True)
+
+    def test_share_generators_by_arch(self):
+        model = BaseTranslationModel(
+            generator=self.generator,
+            discriminator=None,
+            default_domain='A',
+            reachable_domains=['A', 'B'],
+            related_domains=['A', 'B'],
+            data_preprocessor=None,
+            share_generators_by_arch=True)
+        self.assertIs(model.generators['A'], model.generators['B'])
+        model.init_weights()
+
+        model = BaseTranslationModel(
+            generator=self.generator,
+            discriminator=None,
+            default_domain='A',
+            reachable_domains=['A', 'B'],
+            related_domains=['A', 'B'],
+            data_preprocessor=None)
+        self.assertIsNot(model.generators['A'], model.generators['B'])
+
+    def test_init_weights(self):
+        model = ToyTranslationModel(
+            generator=self.generator, discriminator=self.discriminator)
+        model.init_weights()
+        for m in model.modules():
+            self.assertFalse(hasattr(m, '_params_init_info'))
 
     def test_get_module(self):
         generator_mock = MagicMock(spec=MMDistributedDataParallel)
@@ -70,6 +148,311 @@ class TestBaseTranslationModel(TestCase):
             img=torch.randn(1, 3, 64, 64), target_domain=None)
         self.assertEqual(res['target'].shape, (1, 3, 64, 64))
         self.assertEqual(res['source'].shape, (1, 3, 64, 64))
+        self.assertFalse(res['target'].requires_grad)
+
+    def test_forward_inference(self):
+        model = ToyTranslationModel(generator=self.generator)
+        img = torch.randn(1, 3, 64, 64)
+        target = model._forward_inference(img)
+        self.assertTrue(target.is_inference())
+
+        # outputs returned to subclasses can be modified in-place
+        target = model._forward_inference(img, inference_mode=False)
+        self.assertFalse(target.is_inference())
+        self.assertFalse(target.requires_grad)
+        target.clamp_(-1, 1)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason='requires cuda')
+    def test_forward_cuda(self):
+        model = ToyTranslationModel(
+            generator=self.generator, discriminator=None).cuda()
+        img = torch.randn(1, 3, 64, 64).cuda()
+        res = model.forward_test(img=img, target_domain=None)
+        self.assertFalse(res['source'].is_cuda)
+        self.assertFalse(res['target'].is_cuda)
+        self.assertTrue((res['source'] == img.cpu()).all())
+
+    @pytest.mark.skipif(
+        torch.cuda.device_count() < 2, reason='requires multiple gpus')
+    def test_to_host_multi_device(self):
+        tensors = [
+            torch.randn(2, 3, device=f'cuda:{i}', dtype=torch.float16)
+            for i in range(2)
+        ]
+        results = BaseTranslationModel._to_host(*tensors, torch.ones(1))
+        for tensor, result in zip(tensors, results):
+            self.assertFalse(result.is_cuda)
+            self.assertTrue((result == tensor.cpu()).all())
+        self.assertTrue((results[-1] == 1).all())
+
+    def test_translation(self):
+        model = ToyTranslationModel(
+            generator=self.generator, discriminator=None)
+        self.assertTrue(model.is_domain_reachable('A'))
+        self.assertFalse(model.is_domain_reachable('B'))
+        self.assertIs(model._gen_by_domain['A'], model.generators['A'])
+        img = torch.randn(1, 3, 64, 64)
+        self.assertEqual(model.translation(img, 'A').shape, (1, 3, 64, 64))
+        with self.assertRaises(ValueError):
+            model.translation(img, 'B')
+        with self.assertRaises(ValueError):
+            model._get_target_generator('B')
+        self.assertTrue(
+            torch.equal(model.translate_default(img), model.translation(img)))
+        # the default domain takes the fast path without extra arguments
+        with patch.object(
+                model, 'translate_default',
+                wraps=model.translate_default) as mock_default:
+            model.translation(img)
+            model.translation(img, 'A')
+            self.assertEqual(mock_default.call_count, 2)
+            model.forward_test(img=img, target_domain=None)
+            self.assertEqual(mock_default.call_count, 3)
+
+    def test_get_other_domains(self):
+        model = ToyTranslationModel(generator=self.generator)
+        self.assertEqual(model.get_other_domains('A'), ('B', ))
+        self.assertEqual(model.get_other_domains('B'), ('A', ))
+        self.assertEqual(model.get_other_domains('C'), ('A', 'B'))
+
+    def test_compile_generator(self):
+        compiled_gen = MagicMock(side_effect=lambda x: x)
+        with patch('torch.compile', create=True) as compile_mock:
+            compile_mock.return_value = compiled_gen
+            model = ToyTranslationModel(
+                generator=self.generator, compile_generator=True)
+        compile_mock.assert_called_once_with(
+            model.generators['A'], mode='reduce-overhead', dynamic=False)
+        # compiled wrapper should not change the keys of state dict
+        self.assertTrue(
+            all(k.startswith('generators.A.')
+                for k in model.state_dict().keys()))
+
+        # compiled wrapper is not used in training
+        img = torch.randn(1, 3, 64, 64)
+        model.forward_train(img, target_domain='A')
+        compiled_gen.assert_not_called()
+
+        res = model.forward_test(img=img, target_domain=None)
+        compiled_gen.assert_called_once()
+        self.assertTrue((res['target'] == img).all())
+
+        # the output returned to subclasses is not the reused buffer
+        target = model._forward_inference(img, inference_mode=False)
+        self.assertNotEqual(target.data_ptr(), img.data_ptr())
+
+        # shared generators are compiled once
+        with patch('torch.compile', create=True) as compile_mock:
+            compile_mock.return_value = compiled_gen
+            model = BaseTranslationModel(
+                generator=self.generator,
+                discriminator=None,
+                default_domain='A',
+                reachable_domains=['A', 'B'],
+                related_domains=['A', 'B'],
+                data_preprocessor=None,
+                share_generators_by_arch=True,
+                compile_generator=True)
+        compile_mock.assert_called_once()
+        self.assertEqual(len(model._compiled_generators), 1)
+
+    @pytest.mark.skipif(
+        not torch.cuda.is_available() or not hasattr(torch, 'compile'),
+        reason='requires cuda and torch.compile')
+    def test_compile_generator_cuda(self):
+        model = ToyTranslationModel(
+            generator=self.generator, compile_generator=True).cuda().eval()
+        img = torch.randn(1, 3, 64, 64).cuda()
+        with torch.no_grad():
+            expected = model.translation(img)
+        target_1 = model._forward_inference(img, inference_mode=False)
+        target_2 = model._forward_inference(img, inference_mode=False)
+        self.assertTrue(torch.allclose(target_1, expected, atol=1e-3))
+        self.assertTrue(torch.allclose(target_1, target_2, atol=1e-3))
+
+    def test_channels_last(self):
+        model = ToyTranslationModel(
+            generator=self.generator, channels_last=True)
+        for param in model.generators.parameters():
+            if param.dim() == 4:
+                self.assertTrue(
+                    param.is_contiguous(memory_format=torch.channels_last))
+        res = model.forward_test(
+            img=torch.randn(1, 3, 64, 64), target_domain=None)
+        self.assertEqual(res['target'].shape, (1, 3, 64, 64))
+
+    def test_fuse_conv_bn(self):
+        model = ToyTranslationModel(
+            generator=dict(type='ToyConvBNGenerator'), fuse_conv_bn=True)
+        model.eval()
+        img = torch.randn(1, 3, 64, 64)
+        with torch.no_grad():
+            expected = model.translation(img)
+        res = model.forward_test(img=img, target_domain=None)
+        self.assertIn('A', model._fused_domains)
+        self.assertFalse(
+            any(
+                isinstance(m, nn.BatchNorm2d)
+                for m in model.generators['A'].modules()))
+        self.assertTrue(torch.allclose(res['target'], expected, atol=1e-5))
+
+        # do not fuse in training mode
+        model = ToyTranslationModel(
+            generator=dict(type='ToyConvBNGenerator'), fuse_conv_bn=True)
+        model.forward_test(img=img, target_domain=None)
+        self.assertEqual(len(model._fused_domains), 0)
+
+        # shared generators are fused once
+        model = BaseTranslationModel(
+            generator=dict(type='ToyConvBNGenerator'),
+            discriminator=None,
+            default_domain='A',
+            reachable_domains=['A', 'B'],
+            related_domains=['A', 'B'],
+            data_preprocessor=None,
+            share_generators_by_arch=True).eval()
+        model.fuse_for_inference('A')
+        self.assertEqual(model._fused_domains, {'A', 'B'})
+        self.assertIs(model.generators['A'], model.generators['B'])
+
+        # refuse models running generators in training mode at test time
+        model = ToyTranslationModel(generator=dict(type='ToyConvBNGenerator'))
+        model.test_in_train_mode = True
+        with self.assertRaises(RuntimeError):
+            model.eval().fuse_for_inference()
+
+    def test_script_for_inference(self):
+        model = ToyTranslationModel(generator=dict(type='ToyConvBNGenerator'))
+        img = torch.randn(1, 3, 64, 64)
+        with torch.no_grad():
+            expected = model.translation(img)
+        model.script_for_inference()
+        self.assertIsInstance(model.generators['A'], torch.jit.ScriptModule)
+        self.assertIs(model._gen_by_domain['A'], model.generators['A'])
+        res = model.forward_test(img=img, target_domain=None)
+        self.assertTrue(torch.allclose(res['target'], expected, atol=1e-5))
+
+        model = ToyTranslationModel(
+            generator=dict(type='ToyConvBNGenerator')).eval()
+        with torch.no_grad():
+            expected = model.translation(img)
+        model.script_for_inference(freeze=True)
+        self.assertIsInstance(model.generators['A'], torch.jit.ScriptModule)
+        res = model.forward_test(img=img, target_domain=None)
+        self.assertTrue(torch.allclose(res['target'], expected, atol=1e-5))
+
+        # refuse to freeze models running generators in training mode
+        model = ToyTranslationModel(generator=dict(type='ToyConvBNGenerator'))
+        model.test_in_train_mode = True
+        with self.assertRaises(RuntimeError):
+            model.script_for_inference(freeze=True)
+
+    def test_quantize_for_inference(self):
+        model = ToyTranslationModel(
+            generator=dict(type='ToyConvBNGenerator')).eval()
+        calib_imgs = [torch.randn(1, 3, 64, 64) for _ in range(4)]
+        model.quantize_for_inference(calib_imgs)
+        # no float convolution is left
+        self.assertFalse(
+            any(
+                type(m) is nn.Conv2d
+                for m in model.generators['A'].modules()))
+        self.assertIs(model._gen_by_domain['A'], model.generators['A'])
+        res = model.forward_test(img=calib_imgs[0], target_domain=None)
+        self.assertEqual(res['target'].shape, (1, 3, 64, 64))
+
+        # refuse models running generators in training mode
+        model = ToyTranslationModel(generator=dict(type='ToyConvBNGenerator'))
+        model.test_in_train_mode = True
+        with self.assertRaises(RuntimeError):
+            model.quantize_for_inference(calib_imgs)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason='requires cuda')
+    def test_cudnn_benchmark(self):
+        benchmark = torch.backends.cudnn.benchmark
+        try:
+            torch.backends.cudnn.benchmark = False
+            model = ToyTranslationModel(
+                generator=self.generator, cudnn_benchmark=True).cuda()
+            self.assertFalse(torch.backends.cudnn.benchmark)
+
+            flags = []
+
+            def generator(x):
+                flags.append(torch.backends.cudnn.benchmark)
+                return x
+
+            model._gen_by_domain['A'] = generator
+            model.forward_test(
+                img=torch.randn(1, 3, 64, 64).cuda(), target_domain=None)
+            # only enabled during translation
+            self.assertEqual(flags, [True])
+            self.assertFalse(torch.backends.cudnn.benchmark)
+        finally:
+            torch.backends.cudnn.benchmark = benchmark
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason='requires cuda')
+    def test_forward_fp16(self):
+        model = ToyTranslationModel(
+            generator=self.generator, channels_last=True,
+            fp16_enabled=True).cuda()
+        res = model.forward_test(
+            img=torch.randn(1, 3, 64, 64).cuda(), target_domain=None)
+        self.assertEqual(res['target'].dtype, torch.float32)
+        self.assertEqual(res['target'].shape, (1, 3, 64, 64))
+
+        # the path used by `forward_test` of Pix2Pix and CycleGAN
+        target = model._forward_inference(
+            torch.randn(1, 3, 64, 64).cuda(), inference_mode=False)
+        self.assertEqual(target.dtype, torch.float32)
+
+        # weight cache of autocast is only disabled for CUDA Graphs
+        model.eval()
+        for use_cuda_graph in [False, True]:
+            model.use_cuda_graph = use_cuda_graph
+            with patch('torch.autocast', wraps=torch.autocast) as autocast:
+                model._forward_inference(torch.randn(1, 3, 64, 64).cuda())
+            self.assertEqual(autocast.call_args[1]['cache_enabled'],
+                             not use_cuda_graph)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason='requires cuda')
+    def test_forward_cuda_graph(self):
+        model = ToyTranslationModel(
+            generator=self.generator, use_cuda_graph=True).cuda().eval()
+        img = torch.randn(1, 3, 64, 64).cuda()
+        res = model.forward_test(img=img, target_domain=None)
+        self.assertEqual(len(model._graph_cache), 1)
+        with torch.no_grad():
+            expected = model.translation(img).cpu()
+        self.assertTrue(torch.allclose(res['target'], expected, atol=1e-5))
+
+        # replay the captured graph with the same shape
+        img = torch.randn(1, 3, 64, 64).cuda()
+        res = model.forward_test(img=img, target_domain='A')
+        self.assertEqual(len(model._graph_cache), 1)
+        with torch.no_grad():
+            expected = model.translation(img).cpu()
+        self.assertTrue(torch.allclose(res['target'], expected, atol=1e-5))
+
+        # graphs captured in inference mode can be replayed out of it
+        target = model._forward_inference(img, inference_mode=False)
+        self.assertEqual(len(model._graph_cache), 1)
+        self.assertFalse(target.is_inference())
+        self.assertTrue(torch.allclose(target.cpu(), expected, atol=1e-5))
+
+        # do not use graphs in training mode
+        img = torch.randn(2, 3, 64, 64).cuda()
+        model.train()
+        model.forward_test(img=img, target_domain='A')
+        self.assertEqual(len(model._graph_cache), 1)
+
+        # the earliest graph is released when the cache is full
+        model.eval()
+        model.cuda_graph_cache_size = 1
+        model.forward_test(img=img, target_domain='A')
+        self.assertEqual(
+            list(model._graph_cache.keys()),
+            [('A', (2, 3, 64, 64), torch.float32)])
 
 
 def teardown_module():